@@ -2,44 +2,88 @@
 Configuration file for ADK samples.
 
 This file demonstrates how to manage configuration settings for ADK applications.
-In a real application, you would likely load these from environment variables
-using something like python-dotenv.
+Settings are loaded from environment variables (and an optional `.env` file)
+exactly once per process and exposed as an immutable `Settings` object.
+
+If `tools/compile_env.py` has been run, the values are imported from the
+generated `env_cache.py` module instead of parsing `.env` at startup.
 
 Example:
-    import os
-    from dotenv import load_dotenv
-    
-    # Load environment variables from .env file
-    load_dotenv()
-    
-    # Then get values like this:
-    GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+    from config import get_settings
+
+    settings = get_settings()
+    print(settings.default_model)
 """
 
+import functools
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import dotenv_values
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of the sample configuration."""
+
+    google_api_key: Optional[str]
+    default_model: str
+    tool_dispatcher_model: str
+    default_app_name: str
+    default_user_id: str
+    default_session_id: str
+    max_retries: int
+    retry_delay: float
+    llm_cache_dir: Optional[str]
+    llm_cache_semantic: bool
 
-load_dotenv()  # reads .env in cwd
 
-GOOGLE_API_KEY    = os.getenv("GOOGLE_API_KEY")
-DEFAULT_MODEL     = os.getenv("DEFAULT_MODEL", "gemini-2.0-flash")
-DEFAULT_APP_NAME  = os.getenv("DEFAULT_APP_NAME", "my_adk_app")
-DEFAULT_USER_ID   = os.getenv("DEFAULT_USER_ID", "default_user")
-DEFAULT_SESSION_ID= os.getenv("DEFAULT_SESSION_ID", "default_session")
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Loads the configuration on first call and returns the cached instance."""
+    try:
+        import env_cache  # generated by tools/compile_env.py
+    except ImportError:
+        file_values = dotenv_values()  # parses .env without touching os.environ
+    else:
+        file_values = env_cache.VALUES
 
-MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-RETRY_DELAY = float(os.getenv("RETRY_DELAY", "1.0"))
+    # The process environment wins over the file
+    env = {**{k: v for k, v in file_values.items() if v is not None}, **os.environ}
+
+    # Export the file's values like load_dotenv() would: ADK's Gemini client
+    # reads GOOGLE_API_KEY / GOOGLE_GENAI_USE_VERTEXAI / GOOGLE_CLOUD_* from
+    # the environment itself, and some samples read their own keys from it
+    for key, value in file_values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+    return Settings(
+        google_api_key=env.get("GOOGLE_API_KEY"),
+        default_model=env.get("DEFAULT_MODEL", "gemini-2.0-flash"),
+        tool_dispatcher_model=env.get("TOOL_DISPATCHER_MODEL", "gemini-2.0-flash-lite-001"),
+        default_app_name=env.get("DEFAULT_APP_NAME", "my_adk_app"),
+        default_user_id=env.get("DEFAULT_USER_ID", "default_user"),
+        default_session_id=env.get("DEFAULT_SESSION_ID", "default_session"),
+        max_retries=int(env.get("MAX_RETRIES", "3")),
+        retry_delay=float(env.get("RETRY_DELAY", "1.0")),
+        llm_cache_dir=env.get("LLM_CACHE_DIR") or None,
+        llm_cache_semantic=env.get("LLM_CACHE_SEMANTIC", "0") == "1",
+    )
 
 # HOW TO USE THIS CONFIG:
-# 
-# 1. Replace "your_api_key_here" with your actual Google AI API key
-# 
+#
+# 1. Put your actual Google AI API key in a .env file (GOOGLE_API_KEY=...)
+#
 # 2. In your sample scripts, import and use the config like this:
 #
-#    from samples.config import GOOGLE_API_KEY
+#    from config import get_settings
 #    import google.generativeai as genai
-#    
+#
+#    settings = get_settings()
+#
 #    # Configure the Google AI client
-#    genai.configure(api_key=GOOGLE_API_KEY)
+#    genai.configure(api_key=settings.google_api_key)
 #
-# 3. Then you can use the configured genai client in your code 
\ No newline at end of file
+# 3. Then you can use the configured genai client in your code
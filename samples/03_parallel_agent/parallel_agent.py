@@ -7,29 +7,30 @@ their results as a batch.
 
 import sys
 import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from functools import lru_cache
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._harness import register_sample, run_all
+from samples._prompts import PROMPTS
+from samples._runtime import configure_genai, warmup
+
+settings = get_settings()
 
 from google.adk.agents import ParallelAgent, LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
-import google.generativeai as genai
 
 # Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
+configure_genai()
 
 
 # Define some example tools
+@lru_cache(maxsize=128)
 def get_weather(city: str) -> str:
     """Gets the current weather for a city."""
     return f"The weather in {city} is sunny."
 
 
+@lru_cache(maxsize=128)
 def get_news(topic: str) -> str:
     """Gets the latest news on a topic."""
     return f"Latest news about {topic}: Everything is great!"
@@ -38,24 +39,18 @@ def get_news(topic: str) -> str:
 # Create individual agents for different tasks
 weather_agent = LlmAgent(
     name="weather_agent",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     tools=[get_weather],
-    instruction=(
-        "Extract the city name from the user query, call get_weather(city), "
-        "and return only that result."
-    ),
+    instruction=PROMPTS["weather"],
     description="Provides weather information",
     output_key = "weather_info"
 )
 
 news_agent = LlmAgent(
     name="news_agent",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     tools=[get_news],
-    instruction=(
-        "Extract the topic from the user query, call get_news(topic), "
-        "and return only that result."
-    ),
+    instruction=PROMPTS["news"],
     description="Provides news updates",
     output_key="news_info"
 )
@@ -67,50 +62,20 @@ parallel_agent = ParallelAgent(
     description="Fetch weather & news at the same time"
 )
 
-# Set up runner and session for execution
-APP_NAME = DEFAULT_APP_NAME
-USER_ID = DEFAULT_USER_ID
-SESSION_ID = DEFAULT_SESSION_ID
-
-# Create session service and session
-session_service = InMemorySessionService()
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
-)
-
-# Create runner
-runner = Runner(
-    agent=parallel_agent,
-    app_name=APP_NAME,
-    session_service=session_service
-)
+# Run the parallel agent asynchronously so the sub-agents' LLM calls overlap
+@register_sample("03")
+def run_parallel_agent(query):
+    return run_all(parallel_agent, query)
 
 
-# Run the parallel agent using the runner
-def run_parallel_agent(query):
-    # Create content from user query
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=query)]
-    )
-    replies = []
-
-    # Run the agent with the runner
-    for event in runner.run(
-            user_id=USER_ID,
-            session_id=SESSION_ID,
-            new_message=content
-    ):
-        if event.content:
-            replies.append(event.content.parts[0].text)
-    return replies
+# Prepare tool declarations now unless the caller asked for a lazy import
+if not os.environ.get("ADK_LAZY"):
+    warmup(parallel_agent)
 
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
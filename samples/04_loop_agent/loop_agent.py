@@ -7,22 +7,26 @@ enabling iterative refinement or repeated querying.
 
 import sys
 import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from typing import ClassVar
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._harness import register_sample, run
+from samples._prompts import PROMPTS
+from samples._runtime import configure_genai, warmup
+
+settings = get_settings()
 
 from google.adk.agents import LoopAgent, LlmAgent, BaseAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from google.adk.events import Event, EventActions
-import google.generativeai as genai
 
 # Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
+configure_genai()
+
+# Bind the message types once instead of resolving them on `types` per call
+_Content = types.Content
+_Part = types.Part
 
 
 # Define tools
@@ -42,12 +46,9 @@ def guess_number(input_text: str) -> str:
 # Create an agent for guessing
 guess_agent = LlmAgent(
     name="guesser",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     description="Makes a guess at the target number.",
-    instruction=(
-        "You are a number-guessing agent. On each turn, "
-        "call `guess_number(input_text)` and return *only* its output."
-    ),
+    instruction=PROMPTS["guess"],
     tools=[guess_number],
     output_key="last_response"
 )
@@ -57,29 +58,22 @@ guess_agent = LlmAgent(
 class CheckerAgent(BaseAgent):
     """Agent that checks if the guessed number is correct."""
 
+    # "continue" vs "stop" is your protocol; both replies are built once and
+    # indexed by whether the guess was right (EventActions cannot be None)
+    _REPLIES: ClassVar[tuple] = (
+        (_Content(role="assistant", parts=[_Part(text="continue")]), EventActions(escalate=False)),
+        (_Content(role="assistant", parts=[_Part(text="stop")]), EventActions(escalate=True)),
+    )
+
     def __init__(self, name: str):
         super().__init__(name=name)
 
     async def _run_async_impl(self, context):
-        # pull the last guess out of state
-        last = context.session.state.get("last_response", "")
-        # keep looping until we actually saw "42"
-        found = "42" in last
-
-        # "continue" vs "stop" is your protocol
-        verdict = "stop" if found else "continue"
-
-        # ALWAYS supply an EventActions instance (cannot be None)
-        actions = EventActions(escalate=found)
+        # pull the last guess out of state; keep looping until we actually saw "42"
+        content, actions = self._REPLIES["42" in context.session.state.get("last_response", "")]
 
-        yield Event(
-            author=self.name,
-            content=types.Content(
-                role="assistant",
-                parts=[types.Part(text=verdict)]
-            ),
-            actions=actions
-        )
+        # each Event still needs its own id and timestamp
+        yield Event(author=self.name, content=content, actions=actions)
 
 
 # Create the checker agent
@@ -93,50 +87,20 @@ loop_agent = LoopAgent(
     description="Repeatedly guesses a number until correct or max iterations reached",
 )
 
-# Set up runner and session for execution
-APP_NAME = DEFAULT_APP_NAME
-USER_ID = DEFAULT_USER_ID
-SESSION_ID = DEFAULT_SESSION_ID
-
-# Create session service and session
-session_service = InMemorySessionService()
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
-)
-
-# Create runner
-runner = Runner(
-    agent=loop_agent,
-    app_name=APP_NAME,
-    session_service=session_service
-)
-
-
-# Run the loop agent using the runner
+# Run the loop agent using the harness
+@register_sample("04")
 def run_loop_agent(query):
-    # Create content from user query
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=query)]
-    )
+    return run(loop_agent, query)
 
-    # Run the agent with the runner
-    for event in runner.run(
-            user_id=USER_ID,
-            session_id=SESSION_ID,
-            new_message=content
-    ):
-        if event.is_final_response():
-            return event.content.parts[0].text
 
-    return "No response received."
+# Prepare tool declarations now unless the caller asked for a lazy import
+if not os.environ.get("ADK_LAZY"):
+    warmup(loop_agent)
 
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
@@ -8,21 +8,19 @@ special tool_context parameter.
 import sys
 import os
 
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._harness import register_sample, run
+from samples._prompts import PROMPTS
+from samples._runtime import configure_genai, warmup
+
+settings = get_settings()
 
 from google.adk.agents import LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from google.adk.tools import ToolContext
-from google.genai import types
-import google.generativeai as genai
 
 # Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
+configure_genai()
 
 
 # Tool with context access
@@ -37,79 +35,46 @@ def process_document(document_name: str, analysis_query: str, tool_context: Tool
     Returns:
         A dictionary with analysis results or error information.
     """
-    # Access session state
-    previous_queries = tool_context.state.get("previous_queries", [])
+    # Access session state and build the new history once
+    query_history = tool_context.state.get("previous_queries", []) + [analysis_query]
 
     # Update state with the new query
     tool_context.actions.state_delta = {
-        "previous_queries": previous_queries + [analysis_query]
+        "previous_queries": query_history
     }
 
     # Actual document processing would go here
     return {
         "status": "success",
         "analysis": f"Analysis of '{document_name}' regarding '{analysis_query}'",
-        "query_history": previous_queries + [analysis_query]
+        "query_history": query_history
     }
 
 
 # Create the agent with the tool
 document_agent = LlmAgent(
     name="document_analyzer",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     output_key="analysis_result",
     tools=[process_document],
     description="Analyzes a document and records each query in history.",
-    instruction=(
-        "You are a document analysis agent. When the user asks "
-        "'Analyze <document_name> for <analysis_query>', extract both parts, "
-        "call `process_document(document_name, analysis_query, tool_context)`, "
-        "and return *only* the resulting JSON dictionary."
-    )
-)
-
-# Set up runner and session
-APP_NAME = DEFAULT_APP_NAME
-USER_ID = DEFAULT_USER_ID
-SESSION_ID = DEFAULT_SESSION_ID
-
-# Create session service and session
-session_service = InMemorySessionService()
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
+    instruction=PROMPTS["document"]
 )
 
-# Create runner
-runner = Runner(
-    agent=document_agent,
-    app_name=APP_NAME,
-    session_service=session_service
-)
-
-
-# Run the agent
+# Run the agent using the harness
+@register_sample("07")
 def run_document_agent(query):
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=query)]
-    )
+    return run(document_agent, query)
 
-    for event in runner.run(
-            user_id=USER_ID,
-            session_id=SESSION_ID,
-            new_message=content
-    ):
-        if event.is_final_response():
-            return event.content.parts[0].text
 
-    return "No response received."
+# Prepare tool declarations now unless the caller asked for a lazy import
+if not os.environ.get("ADK_LAZY"):
+    warmup(document_agent)
 
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
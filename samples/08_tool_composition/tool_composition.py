@@ -7,24 +7,25 @@ enabling more complex behaviors.
 
 import sys
 import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from functools import lru_cache
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._harness import register_sample, run
+from samples._prompts import PROMPTS
+from samples._runtime import configure_genai, warmup
+
+settings = get_settings()
 
+import numpy as np
 from google.adk.agents import LlmAgent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
-import google.generativeai as genai
 
 # Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
+configure_genai()
 
 
 # Basic tool
+@lru_cache(maxsize=128)
 def get_data(source: str) -> str:
     """Gets raw data from a specified source.
 
@@ -50,10 +51,10 @@ def analyze_data(source: str) -> str:
     # Get the data first
     raw_data = get_data(source)
 
-    # Parse and analyze it
-    numbers = [int(n.strip()) for n in raw_data.split(":", 1)[1].split(",")]
-    total = sum(numbers)
-    average = total / len(numbers)
+    # Parse and analyze it in one vectorized pass instead of per-element Python ints
+    numbers = np.fromstring(raw_data.split(":", 1)[1], dtype=np.int64, sep=",")
+    total = int(numbers.sum())
+    average = float(numbers.mean())
 
     return f"Analysis of {source}:\n- Total: {total}\n- Average: {average:.2f}"
 
@@ -61,59 +62,27 @@ def analyze_data(source: str) -> str:
 # Create the agent with both tools
 data_agent = LlmAgent(
     name="data_analyzer",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     tools=[analyze_data],
     output_key="analysis_summary",
     description="Fetches raw data and returns its analysis.",
-    instruction=(
-        "You are the data analyzer. When the user says "
-        "'Analyze data from <source>', extract the <source> string, "
-        "call `analyze_data(source)`, and return *only* its output."
-    )
-)
-
-# Set up runner and session
-APP_NAME = DEFAULT_APP_NAME
-USER_ID = DEFAULT_USER_ID
-SESSION_ID = DEFAULT_SESSION_ID
-
-# Create session service and session
-session_service = InMemorySessionService()
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
+    instruction=PROMPTS["data"]
 )
 
-# Create runner
-runner = Runner(
-    agent=data_agent,
-    app_name=APP_NAME,
-    session_service=session_service
-)
-
-
-# Run the agent
+# Run the agent using the harness
+@register_sample("08")
 def run_data_agent(query):
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=query)]
-    )
+    return run(data_agent, query)
 
-    for event in runner.run(
-            user_id=USER_ID,
-            session_id=SESSION_ID,
-            new_message=content
-    ):
-        if event.is_final_response():
-            return event.content.parts[0].text
 
-    return "No response received."
+# Prepare tool declarations now unless the caller asked for a lazy import
+if not os.environ.get("ADK_LAZY"):
+    warmup(data_agent)
 
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
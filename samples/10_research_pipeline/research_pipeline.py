@@ -3,28 +3,30 @@ Example of Multi-Source Research Pipeline using Google's ADK.
 
 This example demonstrates parallel composition with a research pipeline that searches
 multiple sources in parallel and then merges the results.
+
+Each source has its own researcher agent and runner; `run_research` awaits all
+three concurrently with `asyncio.gather` and merges their answers locally.
 """
 
+import asyncio
+import functools
 import sys
-import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._llm_cache import Uncacheable, cached_run
+from samples._runtime import configure_genai, user_message
+
+settings = get_settings()
 
-from google.adk.agents import ParallelAgent, LlmAgent, SequentialAgent
+from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
-import google.generativeai as genai
-
-# Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
 
 
 # Define research tools for different sources
+@functools.lru_cache(maxsize=4096)
 def search_news(topic: str) -> str:
     """Searches news sources for information on a topic.
     
@@ -37,6 +39,7 @@ def search_news(topic: str) -> str:
     return f"News results for {topic}: Latest developments include XYZ..."
 
 
+@functools.lru_cache(maxsize=4096)
 def search_academic(topic: str) -> str:
     """Searches academic databases for information on a topic.
     
@@ -49,6 +52,7 @@ def search_academic(topic: str) -> str:
     return f"Academic results for {topic}: Recent papers discuss ABC..."
 
 
+@functools.lru_cache(maxsize=4096)
 def search_social(topic: str) -> str:
     """Searches social media for information on a topic.
     
@@ -64,7 +68,7 @@ def search_social(topic: str) -> str:
 # Create agents for each research source
 news_agent = LlmAgent(
     name="news_researcher",
-    model=DEFAULT_MODEL,
+    model=settings.tool_dispatcher_model,
     tools=[search_news],
     output_key="news_results",
     description="Researches news sources",
@@ -76,7 +80,7 @@ news_agent = LlmAgent(
 
 academic_agent = LlmAgent(
     name="academic_researcher",
-    model=DEFAULT_MODEL,
+    model=settings.tool_dispatcher_model,
     tools=[search_academic],
     output_key="academic_results",
     description="Researches academic sources",
@@ -88,7 +92,7 @@ academic_agent = LlmAgent(
 
 social_agent = LlmAgent(
     name="social_researcher",
-    model=DEFAULT_MODEL,
+    model=settings.tool_dispatcher_model,
     tools=[search_social],
     output_key="social_results",
     description="Researches social media trends",
@@ -98,14 +102,8 @@ social_agent = LlmAgent(
     )
 )
 
-# Create parallel research agent
-parallel_research = ParallelAgent(
-    name="parallel_researcher",
-    sub_agents=[news_agent, academic_agent, social_agent],
-    description="Fetches news, academic, and social results in parallel"
-)
-
-# Create a merger agent to combine results
+# Merge the results of every source into one report
+@functools.lru_cache(maxsize=4096)
 def merge_research(news: str, academic: str, social: str) -> str:
     """Merges research results from multiple sources.
     
@@ -128,74 +126,77 @@ Social Trends: {social}
 This comprehensive view provides a well-rounded perspective on the topic.
 """
 
-merger_agent = LlmAgent(
-    name="research_merger",
-    model=DEFAULT_MODEL,
-    tools=[merge_research],
-    output_key="merged_report",
-    description="Merges research from multiple sources",
-    instruction=(
-        "You have three pieces of state: `news_results`, `academic_results`, "
-        "and `social_results`. Call `merge_research(news_results, academic_results, social_results)` "
-        "and return *only* the resulting combined report string."
-    )
-)
+# Set up runners and sessions
+APP_NAME = settings.default_app_name
+USER_ID = settings.default_user_id
+SESSION_ID = settings.default_session_id
 
-# Create a sequential pipeline that does parallel research then merges
-research_pipeline = SequentialAgent(
-    name="research_pipeline",
-    sub_agents=[parallel_research, merger_agent],
-    description="Runs parallel research and then merges the outputs"
-)
+# Name the merged pipeline is cached under
+PIPELINE_NAME = "research_pipeline"
 
-# Set up runner and session
-APP_NAME = DEFAULT_APP_NAME
-USER_ID = DEFAULT_USER_ID
-SESSION_ID = DEFAULT_SESSION_ID
+researchers = [news_agent, academic_agent, social_agent]
 
-# Create session service and session
+# Create session service; the sessions and runners are created on first use
 session_service = InMemorySessionService()
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
-)
-
-# Create runner
-runner = Runner(
-    agent=research_pipeline,
-    app_name=APP_NAME,
-    session_service=session_service
-)
 
 
-# Run the research pipeline
-def run_research(topic: str) -> str:
-    prompt = types.Content(
-        role="user",
-        parts=[types.Part(text=f"Research this topic: {topic}")]
-    )
+@functools.lru_cache(maxsize=1)
+def get_runners() -> tuple:
+    """Configures the client and builds one session and runner per researcher once."""
+    configure_genai()
+    runners = []
+    for researcher in researchers:
+        session_service.create_session(
+            app_name=APP_NAME,
+            user_id=USER_ID,
+            session_id=f"{SESSION_ID}_{researcher.name}"
+        )
+        runners.append(Runner(
+            agent=researcher,
+            app_name=APP_NAME,
+            session_service=session_service
+        ))
+    return tuple(runners)
+
+
+# What a researcher contributes when its agent gave no final response
+NO_RESPONSE = "No response received."
+
+
+async def _final_text(runner: Runner, prompt: types.Content) -> str:
+    """Runs one researcher and returns its final response text."""
+    text = None
+    async for event in runner.run_async(
+        user_id=USER_ID,
+        session_id=f"{SESSION_ID}_{runner.agent.name}",
+        new_message=prompt
+    ):
+        if event.is_final_response() and event.content and event.content.parts:
+            text = event.content.parts[0].text
+    return (text or NO_RESPONSE).strip()
 
-    merged_report = None
 
-    # Fully consume the event stream
-    for event in runner.run(user_id=USER_ID, session_id=SESSION_ID, new_message=prompt):
-        # Only capture the merger agent's final response
-        if (
-            event.is_final_response()
-            and event.author == "research_merger"
-            and event.content and event.content.parts
-        ):
-            merged_report = event.content.parts[0].text
+# Run the research pipeline
+@cached_run(APP_NAME, PIPELINE_NAME)
+async def run_research(topic: str) -> str:
+    prompt = user_message(f"Research this topic: {topic}")
 
-    return (merged_report or "No response received.").strip()
+    # The three LLM round-trips overlap; merging needs no model call
+    news, academic, social = await asyncio.gather(
+        *(_final_text(runner, prompt) for runner in get_runners())
+    )
+    report = merge_research(news, academic, social).strip()
+    # Don't pin a report with a missing section in the cache
+    if NO_RESPONSE in (news, academic, social):
+        return Uncacheable(report)
+    return report
 
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
-    result = run_research("quantum computing")
+    result = asyncio.run(run_research("quantum computing"))
     print(result) 
\ No newline at end of file
@@ -5,26 +5,25 @@ This example demonstrates how to use a LoopAgent for iterative content refinemen
 repeatedly improving content until a quality threshold is met.
 """
 
+import functools
 import sys
-import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._llm_cache import cached_run
+from samples._prompts import build_instruction
+from samples._runtime import configure_genai, user_message
+
+settings = get_settings()
 
 from google.adk.agents import LoopAgent, LlmAgent, BaseAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from google.adk.events import Event, EventActions
-import google.generativeai as genai
-
-# Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
 
 # Define tools for content creation and critique
+@functools.lru_cache(maxsize=4096)
 def generate_draft(topic: str) -> str:
     """Creates an initial draft on a topic.
     
@@ -37,6 +36,7 @@ def generate_draft(topic: str) -> str:
     return f"Initial draft about {topic}: This is a basic overview of the subject matter..."
 
 
+@functools.lru_cache(maxsize=4096)
 def improve_draft(draft: str, feedback: str) -> str:
     """Improves a draft based on feedback.
     
@@ -53,15 +53,14 @@ def improve_draft(draft: str, feedback: str) -> str:
 # Create agents
 writer_agent = LlmAgent(
     name="writer",
-    model=DEFAULT_MODEL,
-    tools=[generate_draft, improve_draft],
+    model=settings.tool_dispatcher_model,
+    tools=[improve_draft],
     output_key="current_draft",
     description="Writes and refines content drafts",
-    instruction=(
-        "You are the writer. On the first iteration, extract the topic from the user message "
-        "and call `generate_draft(topic)`. On subsequent iterations, take `current_draft` from state "
-        "and `feedback` from state, call `improve_draft(current_draft, feedback)`. "
-        "Return *only* the new draft string."
+    instruction=build_instruction(
+        "You are the writer. Take `current_draft` from state and `feedback` from state, "
+        "call `improve_draft(current_draft, feedback)`, and return *only* the new draft string.",
+        ["current_draft", "feedback"]
     )
 )
 
@@ -76,7 +75,9 @@ class CriticAgent(BaseAgent):
         draft = state.get("current_draft", "")
         iteration = state.get("iteration", 0)
 
-        # simple "quality" model: +25 points per revision
+        # simple "quality" model: +25 points per revision. The critic runs
+        # before the writer, so once the score is high enough the loop ends
+        # without asking the writer for a draft nobody will read.
         quality = min(iteration * 25, 100)
 
         if quality >= 90:
@@ -106,45 +107,56 @@ class CriticAgent(BaseAgent):
 
 critic_agent = CriticAgent(name="critic")
 
-# Create loop agent for iterative refinement
+# Create loop agent for iterative refinement; the critic scores the seeded
+# first draft and each of the four revisions, and escalates on the fifth
+# critique, so the draft goes through as many revisions as before
 content_refiner = LoopAgent(
     name="content_refiner",
-    sub_agents=[writer_agent, critic_agent],
+    sub_agents=[critic_agent, writer_agent],
     max_iterations=5,
     description="Iteratively refines content until quality threshold is met"
 )
 
 # Set up runner and session
-APP_NAME = DEFAULT_APP_NAME
-USER_ID = DEFAULT_USER_ID
-SESSION_ID = DEFAULT_SESSION_ID
+APP_NAME = settings.default_app_name
+USER_ID = settings.default_user_id
+SESSION_ID = settings.default_session_id
 
-# Create session service and session
+# Create session service; the session and runner are created on first use
 session_service = InMemorySessionService()
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
-)
 
-# Create runner
-runner = Runner(
-    agent=content_refiner,
-    app_name=APP_NAME,
-    session_service=session_service
-)
+
+@functools.lru_cache(maxsize=1)
+def get_runner() -> Runner:
+    """Configures the client and builds the runner and its session once."""
+    configure_genai()
+    session_service.create_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        session_id=SESSION_ID
+    )
+    return Runner(
+        agent=content_refiner,
+        app_name=APP_NAME,
+        session_service=session_service
+    )
 
 
 # Run the content refiner
+@cached_run(APP_NAME, content_refiner.name)
 def run_content_refiner(topic: str) -> str:
-    # seed the loop
+    runner = get_runner()
+
+    # seed the loop with the first draft, which generate_draft builds from the
+    # topic alone; get_session returns a copy, so the reset goes through an
+    # event for the service to apply to the stored session
     svc_session = session_service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=SESSION_ID)
-    svc_session.state["iteration"] = 0
+    session_service.append_event(svc_session, Event(
+        author="user",
+        actions=EventActions(state_delta={"iteration": 0, "current_draft": generate_draft(topic), "feedback": ""})
+    ))
 
-    prompt = types.Content(
-        role="user",
-        parts=[types.Part(text=f"Create high-quality content about: {topic}")]
-    )
+    prompt = user_message(f"Create high-quality content about: {topic}")
     final = None
 
     for event in runner.run(user_id=USER_ID, session_id=SESSION_ID, new_message=prompt):
@@ -157,7 +169,7 @@ def run_content_refiner(topic: str) -> str:
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
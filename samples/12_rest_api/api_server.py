@@ -5,32 +5,33 @@ This example demonstrates how to wrap an ADK agent in a web server using FastAPI
 and expose it as an HTTP endpoint.
 """
 
+import functools
 import sys
-import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from contextlib import asynccontextmanager
+from typing import Optional
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._runtime import BoundedSessionService, configure_genai, user_message, warmup
+
+settings = get_settings()
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-import uuid
+import collections
+import itertools
+import msgspec
+import secrets
+import time
 import uvicorn
 
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
-import google.generativeai as genai
-
-# Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
 
 # --- Agent setup ----------------------------------------------------------
 
+@functools.lru_cache(maxsize=4096)
 def answer_question(question: str) -> str:
     """Provides an answer to a question.
     
@@ -44,17 +45,23 @@ def answer_question(question: str) -> str:
 
 agent = LlmAgent(
     name="api_agent",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     tools=[answer_question],
     description="A question-answering agent exposed as an API"
 )
 
-session_service = InMemorySessionService()
-runner = Runner(
-    agent=agent,
-    app_name=DEFAULT_APP_NAME,
-    session_service=session_service
-)
+session_service = BoundedSessionService()
+
+
+@functools.lru_cache(maxsize=1)
+def get_runner() -> Runner:
+    """Configures the client and builds the runner once."""
+    configure_genai()
+    return Runner(
+        agent=agent,
+        app_name=settings.default_app_name,
+        session_service=session_service
+    )
 
 # --- Request/Response models ----------------------------------------------
 
@@ -68,51 +75,124 @@ class QueryResponse(BaseModel):
     session_id: str
     response: str
 
+class WSEvent(msgspec.Struct, omit_defaults=True):
+    """One streamed agent event; unset text/is_final are left out of the JSON."""
+    type: str
+    id: str
+    author: str
+    text: Optional[str] = None
+    is_final: bool = False
+
+# One encoder shared by every WebSocket connection
+_ws_encoder = msgspec.json.Encoder()
+
+# --- ID generation --------------------------------------------------------
+
+# Session IDs only need to be unique within this process
+_session_ids = itertools.count(int(time.time()) * 1000)
+
+# Random user ID suffixes, refilled 64 at a time from one secrets call
+_user_id_pool = collections.deque()
+
+def _new_session_id() -> str:
+    return f"session_{next(_session_ids):x}"
+
+def _random_suffix() -> str:
+    if not _user_id_pool:
+        buf = secrets.token_bytes(256)
+        _user_id_pool.extend(buf[i:i + 4].hex() for i in range(0, len(buf), 4))
+    return _user_id_pool.popleft()
+
+# --- Session pool ---------------------------------------------------------
+
+# Requests without a session_id reuse one of the user's recent sessions, so
+# repeat users keep a stable conversation prefix; idle sessions expire
+SESSION_TTL = 15 * 60
+MAX_POOLED_USERS = 10_000
+
+# user_id -> deque of (session_id, last used), most recent last
+_user_sessions = collections.OrderedDict()
+
+def _acquire_session_id(user_id: str) -> str:
+    pool = _user_sessions.get(user_id)
+    if pool:
+        session_id, last_used = pool.pop()
+        if time.monotonic() - last_used < SESSION_TTL:
+            return session_id
+        # the most recent session is stale, so all the older ones are too
+        pool.clear()
+    return _new_session_id()
+
+def _release_session_id(user_id: str, session_id: str) -> None:
+    pool = _user_sessions.get(user_id)
+    if pool is None:
+        pool = _user_sessions[user_id] = collections.deque(maxlen=4)
+        if len(_user_sessions) > MAX_POOLED_USERS:
+            _user_sessions.popitem(last=False)
+    else:
+        _user_sessions.move_to_end(user_id)
+    pool.append((session_id, time.monotonic()))
+
 # --- FastAPI app ----------------------------------------------------------
 
-app = FastAPI(title="ADK Agent API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the runner and tool declarations before accepting traffic
+    warmup(agent)
+    get_runner()
+    yield
+
+app = FastAPI(title="ADK Agent API", lifespan=lifespan)
 
 @app.post("/query", response_model=QueryResponse)
 async def query_agent(req: QueryRequest):
     # generate IDs if missing
-    user_id = req.user_id or f"user_{uuid.uuid4().hex[:8]}"
-    session_id = req.session_id or f"session_{uuid.uuid4().hex[:8]}"
+    user_id = req.user_id or f"user_{_random_suffix()}"
+    # the client owns the lifecycle of sessions it names
+    session_id = req.session_id or _acquire_session_id(user_id)
 
     # ensure session exists
-    if session_service.get_session(app_name="api_app", user_id=user_id, session_id=session_id) is None:
-        session_service.create_session(app_name="api_app", user_id=user_id, session_id=session_id)
+    session_service.ensure_session(app_name=settings.default_app_name, user_id=user_id, session_id=session_id)
 
     # build message
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=req.query)]
-    )
+    content = user_message(req.query)
 
-    # stream until final and grab the text
+    # grab the final text; no response cache here, since the
+    # answer depends on the session's history and every turn must be recorded
     response_text = None
-    async for event in runner.run_async(
+    # Read the stream to the end: closing it early cuts ADK's tracing spans
+    # short and OpenTelemetry logs a traceback for every request
+    async for event in get_runner().run_async(
         user_id=user_id,
         session_id=session_id,
         new_message=content
     ):
-        if event.is_final_response() and event.content and event.content.parts:
+        if response_text is None and event.is_final_response() and event.content and event.content.parts:
             response_text = event.content.parts[0].text
 
+    if req.session_id is None:
+        _release_session_id(user_id, session_id)
+
     return QueryResponse(
         user_id=user_id,
         session_id=session_id,
         response=response_text or ""
     )
 
+@app.post("/admin/flush")
+async def flush_caches():
+    # drop memoized tool results, e.g. after a redeploy
+    answer_question.cache_clear()
+    return {"status": "flushed"}
+
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(ws: WebSocket, session_id: str):
     await ws.accept()
     # each WS connection gets its own user_id
-    user_id = f"ws_user_{uuid.uuid4().hex[:8]}"
+    user_id = f"ws_user_{_random_suffix()}"
 
     # ensure session exists
-    if session_service.get_session(app_name="api_app", user_id=user_id, session_id=session_id) is None:
-        session_service.create_session(app_name="api_app", user_id=user_id, session_id=session_id)
+    session_service.ensure_session(app_name=settings.default_app_name, user_id=user_id, session_id=session_id)
 
     # let client know its user_id
     await ws.send_json({"type": "session_init", "user_id": user_id, "session_id": session_id})
@@ -120,28 +200,22 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
     try:
         while True:
             query = await ws.receive_text()
-            content = types.Content(
-                role="user",
-                parts=[types.Part(text=query)]
-            )
+            content = user_message(query)
 
-            # stream all events, pushing each as JSON
-            async for event in runner.run_async(
+            # stream all events, pushing each as JSON (still as text frames)
+            async for event in get_runner().run_async(
                 user_id=user_id,
                 session_id=session_id,
                 new_message=content
             ):
-                payload = {
-                    "type": "event",
-                    "id": event.id,
-                    "author": event.author,
-                }
-                if event.content and event.content.parts:
-                    payload["text"] = event.content.parts[0].text
-                if event.is_final_response():
-                    payload["is_final"] = True
-
-                await ws.send_json(payload)
+                payload = WSEvent(
+                    type="event",
+                    id=event.id,
+                    author=event.author,
+                    text=event.content.parts[0].text if event.content and event.content.parts else None,
+                    is_final=event.is_final_response(),
+                )
+                await ws.send_text(_ws_encoder.encode(payload).decode())
 
     except WebSocketDisconnect:
         # client closed connection
@@ -152,8 +226,10 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
         await ws.close()
 
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop and httptools come with uvicorn[standard]; keep a single worker,
+    # since sessions live in this process's memory
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
\ No newline at end of file
@@ -5,28 +5,29 @@ This example demonstrates how to run agents on a schedule or trigger them based
 on external events.
 """
 
+import asyncio
+import functools
+import signal
 import sys
-import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._runtime import configure_genai, user_message
+
+settings = get_settings()
 
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
-from google.genai import types
 import time
-import schedule
 import json
-import google.generativeai as genai
 
-# Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
+import aiofiles
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
 
 # Create an agent that summarizes data
+@functools.lru_cache(maxsize=4096)
 def summarize_data(source: str) -> str:
     """Summarizes data from a source.
     
@@ -41,41 +42,96 @@ def summarize_data(source: str) -> str:
 
 summary_agent = LlmAgent(
     name="summary_agent",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     tools=[summarize_data],
     description="An agent that summarizes data on a schedule"
 )
 
-# Set up runner
+# Set up the session service; the runner is created on first use
 session_service = InMemorySessionService()
-runner = Runner(
-    agent=summary_agent,
-    app_name=DEFAULT_APP_NAME,
-    session_service=session_service
-)
+
+
+@functools.lru_cache(maxsize=1)
+def get_runner() -> Runner:
+    """Configures the client and builds the runner once."""
+    configure_genai()
+    return Runner(
+        agent=summary_agent,
+        app_name=settings.default_app_name,
+        session_service=session_service
+    )
+
+# Data sources summarized by the daily job
+DATA_SOURCES = ["our analytics database"]
+
+# Log lines are handed to a background writer task, so jobs never wait on
+# file I/O; the task is started by the first job that logs something
+_log_queue = asyncio.Queue()
+_log_writer_task = None
+
+
+async def _log_writer() -> None:
+    async with aiofiles.open("summaries.log", "a", buffering=1 << 16) as log_file:
+        while True:
+            line = await _log_queue.get()
+            await log_file.write(line)
+            # flush once the backlog is written rather than after every line
+            if _log_queue.empty():
+                await log_file.flush()
+            _log_queue.task_done()
+
+
+def _write_log(log_entry: dict) -> None:
+    global _log_writer_task
+    if _log_writer_task is None:
+        _log_writer_task = asyncio.create_task(_log_writer())
+    _log_queue.put_nowait(json.dumps(log_entry) + "\n")
+
+
+async def _drain_log(timeout: float = 10.0) -> None:
+    """Waits for queued lines to be written, then stops the writer.
+
+    Gives up after `timeout` seconds, or at once if the writer has died,
+    instead of waiting on a queue nobody is emptying.
+    """
+    writer = _log_writer_task
+    if writer is None:
+        return
+    if not writer.done():
+        joined = asyncio.create_task(_log_queue.join())
+        await asyncio.wait({joined, writer}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        joined.cancel()
+        # cancelling the writer closes the file
+        writer.cancel()
+    try:
+        await writer
+    except asyncio.CancelledError:
+        pass
+    except Exception as exc:
+        print(f"Log writer failed: {exc!r}")
+    if not _log_queue.empty():
+        print(f"{_log_queue.qsize()} log lines were not written.")
+
 
 # Function to run the summary job
-def run_summary_job():
+async def run_summary_job(sources: list[str]):
     print(f"Running scheduled summary job at {time.strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Create a unique session for this run
     session_id = f"job_{int(time.time())}"
     session = session_service.create_session(
-        app_name=DEFAULT_APP_NAME,
-        user_id=DEFAULT_USER_ID,
+        app_name=settings.default_app_name,
+        user_id=settings.default_user_id,
         session_id=session_id
     )
     
-    # Create content with the job request
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text="Summarize today's data from our analytics database")]
-    )
+    # Ask for every source in one request rather than one LLM call per source
+    content = user_message("Summarize today's data from these sources:\n- " + "\n- ".join(sources))
     
     # Run the agent
     summary = None
-    for event in runner.run(
-        user_id=DEFAULT_USER_ID,
+    async for event in get_runner().run_async(
+        user_id=settings.default_user_id,
         session_id=session_id,
         new_message=content
     ):
@@ -89,31 +145,45 @@ def run_summary_job():
         # - Trigger an alert if certain conditions are met
         print(f"Summary generated: {summary}")
         
-        # Example: Write to a log file
-        with open("summaries.log", "a") as log_file:
-            log_entry = {
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "session_id": session_id,
-                "summary": summary
-            }
-            log_file.write(json.dumps(log_entry) + "\n")
+        # Example: Write to a log file, one entry per batch
+        _write_log({
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "session_id": session_id,
+            "sources": sources,
+            "summary": summary
+        })
     else:
         print("No summary generated.")
 
 # Schedule the job to run daily at 8:00 AM
-schedule.every().day.at("08:00").do(run_summary_job)
+scheduler = AsyncIOScheduler()
+scheduler.add_job(run_summary_job, CronTrigger(hour=8, minute=0), args=[DATA_SOURCES])
+
+
+async def main():
+    # SIGTERM (e.g. `docker stop`) and SIGINT (Ctrl+C) end the loop below
+    # instead of killing the process with log lines still queued
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop.set)
+
+    scheduler.start()
+
+    # Run once immediately for testing
+    await run_summary_job(DATA_SOURCES)
+
+    # Then sleep until the scheduler fires the next job, or we are stopped
+    await stop.wait()
+    scheduler.shutdown(wait=False)
+
+    await _drain_log()
 
 # Run the scheduler
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
     print("Starting scheduler...")
-    # Run once immediately for testing
-    run_summary_job()
-    
-    # Then run on schedule
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file
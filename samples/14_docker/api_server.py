@@ -4,34 +4,29 @@ API Server for Docker deployment example.
 This is a simple FastAPI server for the Docker container example.
 """
 
-import sys
+import functools
 import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from contextlib import asynccontextmanager
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._runtime import BoundedSessionService, configure_genai, user_message, warmup
+
+settings = get_settings()
 
 from fastapi import FastAPI
 from pydantic import BaseModel
 
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
-import google.generativeai as genai
-
-# Configure the Google AI client with API key from environment or config
-API_KEY = os.environ.get("GOOGLE_API_KEY", GOOGLE_API_KEY)
-genai.configure(api_key=API_KEY)
 
 # Get environment variables with fallbacks to config
-APP_NAME = os.environ.get("APP_NAME", DEFAULT_APP_NAME)
-MODEL_NAME = os.environ.get("MODEL_NAME", DEFAULT_MODEL)
+APP_NAME = os.environ.get("APP_NAME", settings.default_app_name)
+MODEL_NAME = os.environ.get("MODEL_NAME", settings.default_model)
 
 # --- Agent setup ----------------------------------------------------------
 
+@functools.lru_cache(maxsize=4096)
 def get_answer(question: str) -> str:
     """Provides an answer to a question.
     
@@ -51,13 +46,19 @@ agent = LlmAgent(
     description="A simple question-answering agent for Docker deployment."
 )
 
-# Set up session service and runner
-session_service = InMemorySessionService()
-runner = Runner(
-    agent=agent,
-    app_name=APP_NAME,
-    session_service=session_service
-)
+# Set up session service; the runner is created on first use
+session_service = BoundedSessionService()
+
+
+@functools.lru_cache(maxsize=1)
+def get_runner() -> Runner:
+    """Configures the client with the API key and builds the runner once."""
+    configure_genai()
+    return Runner(
+        agent=agent,
+        app_name=APP_NAME,
+        session_service=session_service
+    )
 
 # --- API Models ----------------------------------------------------------
 
@@ -71,7 +72,14 @@ class QueryResponse(BaseModel):
 
 # --- FastAPI App ---------------------------------------------------------
 
-app = FastAPI(title="ADK Agent API", description="Example API for ADK Agent in Docker")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the runner and tool declarations before accepting traffic
+    warmup(agent)
+    get_runner()
+    yield
+
+app = FastAPI(title="ADK Agent API", description="Example API for ADK Agent in Docker", lifespan=lifespan)
 
 @app.get("/")
 def read_root():
@@ -80,23 +88,28 @@ def read_root():
 @app.post("/ask", response_model=QueryResponse)
 async def ask_question(req: QueryRequest):
     # Ensure session exists
-    if session_service.get_session(app_name=APP_NAME, user_id=req.user_id, session_id=req.session_id) is None:
-        session_service.create_session(app_name=APP_NAME, user_id=req.user_id, session_id=req.session_id)
+    session_service.ensure_session(app_name=APP_NAME, user_id=req.user_id, session_id=req.session_id)
     
     # Create message content
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=req.question)]
-    )
-    
-    # Run the agent
+    content = user_message(req.question)
+
+    # Run the agent; answers depend on the session's history, so they are
+    # not served from a response cache
     response_text = None
-    async for event in runner.run_async(
+    # Read the stream to the end: closing it early cuts ADK's tracing spans
+    # short and OpenTelemetry logs a traceback for every request
+    async for event in get_runner().run_async(
         user_id=req.user_id,
         session_id=req.session_id,
         new_message=content
     ):
-        if event.is_final_response() and event.content and event.content.parts:
+        if response_text is None and event.is_final_response() and event.content and event.content.parts:
             response_text = event.content.parts[0].text
     
-    return QueryResponse(answer=response_text or "No answer available.") 
\ No newline at end of file
+    return QueryResponse(answer=response_text or "No answer available.") 
+
+@app.post("/admin/flush")
+async def flush_caches():
+    # Drop memoized tool results, e.g. after a redeploy
+    get_answer.cache_clear()
+    return {"status": "flushed"}
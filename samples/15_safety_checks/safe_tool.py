@@ -5,28 +5,81 @@ This example demonstrates how to implement validation and safety checks for tool
 """
 
 import sys
-import os
 import re
 import logging
+from functools import lru_cache
+from typing import Optional
 
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import numpy as np
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._runtime import configure_genai, user_message
+
+settings = get_settings()
 
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
-from google.genai import types
-import google.generativeai as genai
-
-# Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Recipient domains send_email may deliver to
+_ALLOWED_DOMAINS = frozenset({"mycompany.com", "partner.org"})
+
+# Terms that must not appear in an email body, matched in a single pass over
+# the lowercased body (a case-sensitive search of body.lower() is several
+# times faster than re.IGNORECASE)
+_SENSITIVE_TERMS = ("password", "ssn", "secret", "confidential")
+_SENSITIVE_RE = re.compile("|".join(_SENSITIVE_TERMS))
+# Their first letters in either case; a body containing none of them cannot match
+_SENSITIVE_FIRST = frozenset(c for term in _SENSITIVE_TERMS for c in (term[0], term[0].upper()))
+# The same letters as a byte lookup table, for scanning long bodies in numpy
+_SENSITIVE_FIRST_LUT = np.zeros(256, dtype=np.bool_)
+_SENSITIVE_FIRST_LUT[[ord(c) for c in _SENSITIVE_FIRST]] = True
+# Below this length the set check beats the numpy call overhead
+_LUT_MIN_LENGTH = 512
+
+# Error responses are fixed, so they are built once and copied per call
+_INVALID_FORMAT = {"status": "error", "message": "Invalid email format"}
+_DISALLOWED_DOMAIN = {
+    "status": "error",
+    "message": f"Can only send to these domains: {', '.join(sorted(_ALLOWED_DOMAINS))}"
+}
+_SENSITIVE_CONTENT = {
+    term: {"status": "error", "message": f"Cannot send emails containing sensitive terms: {term}"}
+    for term in _SENSITIVE_TERMS
+}
+
+@lru_cache(maxsize=1024)
+def _validate_recipient(to: str) -> Optional[tuple]:
+    """Checks a stripped, lowercased recipient; agents tend to reuse the same few.
+
+    Returns:
+        None if the address is accepted, otherwise a `(warning, response)`
+        pair: a log format string taking the address, and the response to
+        return (copied) to the agent. Call `cache_clear()` if
+        `_ALLOWED_DOMAINS` ever changes.
+    """
+    # Cheapest checks first: the domain lookup rejects most bad addresses
+    local, at, domain = to.rpartition("@")
+    if at and domain not in _ALLOWED_DOMAINS:
+        return "Attempt to send to non-allowed domain: %s", _DISALLOWED_DOMAIN
+    # Every allowed domain is a dotted name, so a well-formed address only
+    # needs a non-empty local part without a second "@"
+    if not local or local.find("@") != -1:
+        return "Invalid email format detected: %s", _INVALID_FORMAT
+    return None
+
+def _may_be_sensitive(body: str) -> bool:
+    """Cheap prescreen: False if the body cannot contain a sensitive term."""
+    if len(body) < _LUT_MIN_LENGTH:
+        return not _SENSITIVE_FIRST.isdisjoint(body)
+    # The terms are ASCII, and UTF-8 keeps ASCII bytes as they are
+    data = np.frombuffer(body.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+    return bool(_SENSITIVE_FIRST_LUT[data].any())
+
 # Example of a tool with built-in safety checks
 def send_email(to: str, subject: str, body: str) -> dict:
     """Sends an email to the specified recipient.
@@ -39,33 +92,25 @@ def send_email(to: str, subject: str, body: str) -> dict:
     Returns:
         A dictionary with status information.
     """
-    # Safety check: Validate email format
-    if not re.match(r"[^@]+@[^@]+\.[^@]+", to):
-        logging.warning(f"Invalid email format detected: {to}")
-        return {"status": "error", "message": "Invalid email format"}
-    
-    # Safety check: Check allowed domains
-    allowed_domains = ["mycompany.com", "partner.org"]
-    if not any(to.endswith(f"@{domain}") for domain in allowed_domains):
-        logging.warning(f"Attempt to send to non-allowed domain: {to}")
-        return {
-            "status": "error", 
-            "message": f"Can only send to these domains: {', '.join(allowed_domains)}"
-        }
+    # Normalize the recipient once for every check below
+    to_norm = to.strip().lower()
+
+    # Safety checks: Validate the recipient's format and domain
+    if (rejection := _validate_recipient(to_norm)) is not None:
+        warning, response = rejection
+        logging.warning(warning, to)
+        return response.copy()
     
     # Safety check: Check for sensitive content
-    sensitive_terms = ["password", "ssn", "secret", "confidential"]
-    for term in sensitive_terms:
-        if term in body.lower():
-            logging.warning(f"Sensitive term detected in email body: {term}")
-            return {
-                "status": "error", 
-                "message": f"Cannot send emails containing sensitive terms: {term}"
-            }
+    # Only bodies that pass the prescreen are lowercased, and only once
+    if _may_be_sensitive(body) and (match := _SENSITIVE_RE.search(body.lower())):
+        term = match.group(0)
+        logging.warning("Sensitive term detected in email body: %s", term)
+        return _SENSITIVE_CONTENT[term].copy()
     
     # In a real implementation, this would actually send the email
     # For this example, we'll just simulate it
-    logging.info(f"Email sent to {to} with subject: {subject}")
+    logging.info("Email sent to %s with subject: %s", to, subject)
     
     return {
         "status": "success", 
@@ -78,39 +123,40 @@ def send_email(to: str, subject: str, body: str) -> dict:
 # Create the agent with the secure tool
 email_agent = LlmAgent(
     name="email_agent",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     tools=[send_email],
     description="An agent that can send emails with safety checks"
 )
 
 # Set up runner and session
-APP_NAME = DEFAULT_APP_NAME
-USER_ID = DEFAULT_USER_ID
-SESSION_ID = DEFAULT_SESSION_ID
+APP_NAME = settings.default_app_name
+USER_ID = settings.default_user_id
+SESSION_ID = settings.default_session_id
 
-# Create session service and session
+# Set up the session service; the runner is created on first use
 session_service = InMemorySessionService()
-session = session_service.create_session(
-    app_name=APP_NAME,
-    user_id=USER_ID,
-    session_id=SESSION_ID
-)
 
-# Create runner
-runner = Runner(
-    agent=email_agent,
-    app_name=APP_NAME,
-    session_service=session_service
-)
+
+@lru_cache(maxsize=1)
+def get_runner() -> Runner:
+    """Configures the client and builds the runner and its session once."""
+    configure_genai()
+    session_service.create_session(
+        app_name=APP_NAME,
+        user_id=USER_ID,
+        session_id=SESSION_ID
+    )
+    return Runner(
+        agent=email_agent,
+        app_name=APP_NAME,
+        session_service=session_service
+    )
 
 # Run the agent with safety checks
 def run_email_agent(query):
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=query)]
-    )
+    content = user_message(query)
     
-    for event in runner.run(
+    for event in get_runner().run(
         user_id=USER_ID,
         session_id=SESSION_ID,
         new_message=content
@@ -122,7 +168,7 @@ def run_email_agent(query):
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
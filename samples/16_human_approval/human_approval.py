@@ -5,26 +5,92 @@ This example demonstrates how to implement human approval steps for
 significant actions.
 """
 
+import asyncio
+import functools
 import sys
-import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import from the root config
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, DEFAULT_USER_ID, DEFAULT_SESSION_ID
+from config import get_settings
+from samples._runtime import configure_genai, user_message
+
+settings = get_settings()
 
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
-from google.genai import types
-import google.generativeai as genai
 
-# Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
+# Reviewer decisions for proposals the model has made but not yet executed,
+# keyed by (action_type, details)
+_DECISIONS = {}
+
+
+def _ask_reviewer(proposals: list) -> list:
+    """Shows proposals to the reviewer and reads one decision line for all of them."""
+    for number, (action_type, details) in enumerate(proposals, 1):
+        print(f"\n=== ACTION REQUIRING APPROVAL ({number}/{len(proposals)}) ===")
+        print(f"Type: {action_type}")
+        print(f"Details: {details}")
+
+    # Simple console-based approval for demo purposes
+    if len(proposals) == 1:
+        prompt = "Approve? (y/n): "
+    else:
+        prompt = "Approve? (a = all, s = skip all, or y/n per action, e.g. 'yn'): "
+    while True:
+        decisions = _parse_decisions(input(prompt), len(proposals))
+        if decisions is not None:
+            return decisions
+        print("Please answer with y/yes or n/no" + (" for each action." if len(proposals) > 1 else "."))
+
+
+_ANSWERS = {"y": True, "yes": True, "n": False, "no": False}
+
+
+def _parse_decisions(answer: str, count: int):
+    """Turns a reviewer's answer into one decision per proposal.
+
+    Returns:
+        A list of `count` booleans, or None if the answer is not recognized.
+    """
+    answer = answer.strip().lower()
+    if count > 1 and answer in ("a", "all", "s", "skip"):
+        return [answer.startswith("a")] * count
+    words = answer.replace(",", " ").split()
+    if len(words) == 1 and count > 1:
+        words = list(words[0])  # compact form, e.g. "yn"
+    if len(words) != count or any(word not in _ANSWERS for word in words):
+        return None
+    return [_ANSWERS[word] for word in words]
+
+
+async def _review(proposals: list) -> None:
+    # The prompt blocks in a worker thread so the runner's event loop keeps
+    # going while we wait
+    loop = asyncio.get_running_loop()
+    decisions = await loop.run_in_executor(None, _ask_reviewer, proposals)
+    _DECISIONS.update(zip(proposals, decisions))
+
+
+async def _flush_approvals(callback_context, llm_response):
+    """Asks for every proposal of a model turn at once, before the tools run.
+
+    ADK executes a turn's function calls one after another, so prompting
+    from inside `propose_action` would cost the reviewer one round-trip per
+    proposal.
+    """
+    parts = llm_response.content.parts if llm_response.content else None
+    pending = [
+        (call.args.get("action_type", ""), call.args.get("details", ""))
+        for part in parts or []
+        if (call := part.function_call) and call.name == "propose_action" and call.args
+    ]
+    if pending:
+        await _review(pending)
+    return None
+
 
 # Tool that requires human approval
-def propose_action(action_type: str, details: str) -> dict:
+async def propose_action(action_type: str, details: str) -> dict:
     """Proposes an action that requires human approval.
     
     Args:
@@ -39,14 +105,12 @@ def propose_action(action_type: str, details: str) -> dict:
     # - Send an email notification
     # - Update a dashboard
     
-    print(f"\n=== ACTION REQUIRING APPROVAL ===")
-    print(f"Type: {action_type}")
-    print(f"Details: {details}")
-    
-    # Simple console-based approval for demo purposes
-    approval = input("Approve? (y/n): ")
+    # Proposals are normally reviewed in a batch by _flush_approvals
+    proposal = (action_type, details)
+    if proposal not in _DECISIONS:
+        await _review([proposal])
     
-    if approval.lower() == 'y':
+    if _DECISIONS.pop(proposal):
         return {
             "status": "approved",
             "message": "Action approved by human reviewer",
@@ -64,8 +128,9 @@ def propose_action(action_type: str, details: str) -> dict:
 # Create agent with human-in-the-loop design
 human_oversight_agent = LlmAgent(
     name="overseen_agent",
-    model=DEFAULT_MODEL,
+    model=settings.default_model,
     tools=[propose_action],
+    after_model_callback=_flush_approvals,
     instruction="""You are an agent with human oversight.
     For any significant action, use the propose_action tool to get approval before proceeding.
     Significant actions include:
@@ -77,33 +142,34 @@ human_oversight_agent = LlmAgent(
     description="Agent that requires human approval for significant actions"
 )
 
-# Set up runner
+# Set up the session service; the runner is created on first use
 session_service = InMemorySessionService()
-runner = Runner(
-    agent=human_oversight_agent,
-    app_name=DEFAULT_APP_NAME,
-    session_service=session_service
-)
+
+
+@functools.lru_cache(maxsize=1)
+def get_runner() -> Runner:
+    """Configures the client and builds the runner and its session once."""
+    configure_genai()
+    session_service.create_session(
+        app_name=settings.default_app_name,
+        user_id=settings.default_user_id,
+        session_id=settings.default_session_id
+    )
+    return Runner(
+        agent=human_oversight_agent,
+        app_name=settings.default_app_name,
+        session_service=session_service
+    )
 
 # Function to run the agent
 def run_overseen_agent(query):
-    # Create a session
-    session = session_service.create_session(
-        app_name=DEFAULT_APP_NAME,
-        user_id=DEFAULT_USER_ID,
-        session_id=DEFAULT_SESSION_ID
-    )
-    
     # Create content
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=query)]
-    )
+    content = user_message(query)
     
     # Run the agent
-    for event in runner.run(
-        user_id=DEFAULT_USER_ID,
-        session_id=DEFAULT_SESSION_ID,
+    for event in get_runner().run(
+        user_id=settings.default_user_id,
+        session_id=settings.default_session_id,
         new_message=content
     ):
         if event.is_final_response():
@@ -113,7 +179,7 @@ def run_overseen_agent(query):
 
 # Example usage
 if __name__ == "__main__":
-    if not GOOGLE_API_KEY:
+    if not settings.google_api_key:
         print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
         sys.exit(1)
         
@@ -0,0 +1 @@
+"""ADK samples. Run a basic sample with `python -m samples <number> "<query>"`."""
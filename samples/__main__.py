@@ -0,0 +1,3 @@
+from samples._harness import main
+
+main()
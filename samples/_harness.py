@@ -0,0 +1,141 @@
+"""
+Harness shared by the basic ADK samples.
+
+Each sample only defines its agent and registers an entry point with
+`register_sample`; the harness owns runner creation, message construction and
+final-response extraction. Any registered sample can be run from the project
+root with:
+
+    python -m samples 01 "What's the weather like in Berlin?"
+
+`run` and `run_all` start their own event loop; code that is already running
+in one (a notebook, a web handler) should await `arun` / `arun_all` instead.
+"""
+
+import argparse
+import asyncio
+import glob
+import importlib
+import os
+
+from config import get_settings
+from samples._runtime import make_runner, session_id_for, user_message
+
+settings = get_settings()
+
+# Registered sample entry points, keyed by sample number (e.g. "01")
+SAMPLES = {}
+
+# Runners are created on first use and cached per root agent object, keyed
+# by id() with the agent kept alongside so the id cannot be reused
+_runners = {}
+
+
+def register_sample(name: str):
+    """Registers a sample's `run_*` function so the CLI can find it.
+
+    Args:
+        name: The sample number, matching its directory prefix (e.g. "01").
+
+    Returns:
+        A decorator that records the function and returns it unchanged.
+    """
+    def decorator(func):
+        SAMPLES[name] = func
+        return func
+    return decorator
+
+
+def get_runner(agent):
+    """Returns the runner for an agent, creating it and its session on first use."""
+    entry = _runners.get(id(agent))
+    if entry is None or entry[0] is not agent:
+        entry = _runners[id(agent)] = (agent, make_runner(agent))
+    return entry[1]
+
+
+async def arun(agent, query: str, author: str = None) -> str:
+    """Async version of `run`, for callers that already have an event loop."""
+    # The stream is read to the end rather than closed early: closing it
+    # mid-run cuts ADK's tracing spans short and OpenTelemetry logs a
+    # traceback for every call
+    final = None
+    async for event in get_runner(agent).run_async(
+            user_id=settings.default_user_id,
+            session_id=session_id_for(agent),
+            new_message=user_message(query)
+    ):
+        if final is None and event.is_final_response() and (author is None or event.author == author):
+            final = event
+    if final and final.content and (parts := final.content.parts):
+        return parts[0].text
+    return "No response received."
+
+
+def run(agent, query: str, author: str = None) -> str:
+    """Runs a query and returns the text of the first final response.
+
+    Any events after it are consumed and ignored.
+
+    Args:
+        agent: The root agent to run.
+        query: The user message.
+        author: Only accept the final response of this agent, for pipelines
+            where every sub-agent emits one.
+
+    Returns:
+        The response text, or a placeholder if the agent did not answer.
+    """
+    return asyncio.run(arun(agent, query, author))
+
+
+async def arun_all(agent, query: str) -> list:
+    """Async version of `run_all`, for callers that already have an event loop."""
+    replies = []
+    async for event in get_runner(agent).run_async(
+            user_id=settings.default_user_id,
+            session_id=session_id_for(agent),
+            new_message=user_message(query)
+    ):
+        if event.content and (parts := event.content.parts):
+            replies.append(parts[0].text)
+    return replies
+
+
+def run_all(agent, query: str) -> list:
+    """Runs a query asynchronously and returns the text of every event.
+
+    Driving the runner with `run_async` lets sub-agents of a ParallelAgent
+    overlap their LLM calls.
+    """
+    return asyncio.run(arun_all(agent, query))
+
+
+def _load_sample(name: str) -> None:
+    """Imports the modules of a sample directory so it registers itself."""
+    root = os.path.dirname(__file__)
+    for path in glob.glob(os.path.join(root, f"{name}_*", "*.py")):
+        package = os.path.basename(os.path.dirname(path))
+        module = os.path.splitext(os.path.basename(path))[0]
+        importlib.import_module(f"samples.{package}.{module}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m samples", description="Run an ADK sample")
+    parser.add_argument("sample", help="sample number, e.g. 01")
+    parser.add_argument("query", help="message to send to the sample's agent")
+    args = parser.parse_args(argv)
+
+    _load_sample(args.sample)
+    if args.sample not in SAMPLES:
+        parser.error(f"unknown sample {args.sample!r}")
+
+    if not settings.google_api_key:
+        parser.exit(1, "Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.\n")
+
+    result = SAMPLES[args.sample](args.query)
+    if isinstance(result, list):
+        for i, reply in enumerate(result):
+            print(f"{i+1}. {reply}")
+    else:
+        print(result)
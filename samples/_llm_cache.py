@@ -0,0 +1,223 @@
+"""
+Response cache for the LLM-backed sample entry points.
+
+Identical prompts are answered from an exact-match LRU keyed on the app name,
+agent name and normalized prompt. Two optional tiers sit behind it:
+
+- a semantic tier (`LLM_CACHE_SEMANTIC=1`) that embeds each missed prompt and
+  returns a stored response when a previous prompt sent to the same app and
+  agent has a cosine similarity above the threshold;
+- a persistent tier (`LLM_CACHE_DIR=/tmp/adk_cache`) backed by `diskcache`,
+  so repeated runs of a script start warm.
+
+Example:
+    from samples._llm_cache import cached_run
+
+    @cached_run(APP_NAME, "document_processor")
+    def run_document_pipeline(document_path: str) -> str:
+        ...
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from config import get_settings
+from samples._runtime import configure_genai
+
+import google.generativeai as genai
+
+try:
+    import diskcache
+except ImportError:  # persistence is optional
+    diskcache = None
+
+settings = get_settings()
+
+EMBEDDING_MODEL = "models/text-embedding-004"
+
+# Placeholders the entry points return when the agent did not answer
+_UNCACHEABLE = frozenset({"", "No response received.", "No answer available."})
+
+
+class Uncacheable(str):
+    """A response text `put` must not store, e.g. one built from a failed step.
+
+    Entry points return it like a plain str; callers see no difference.
+    """
+
+
+def _normalize(prompt: str) -> str:
+    return " ".join(prompt.split()).casefold()
+
+
+class PromptCache:
+    """Two-tier (exact, then semantic) cache of final response texts."""
+
+    def __init__(self, maxsize: int = 1024, threshold: float = 0.95,
+                 semantic: bool = False, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.semantic = semantic
+        self._exact = OrderedDict()
+        self._disk = diskcache.Cache(directory) if directory and diskcache else None
+        # (app_name, agent_name) -> (matrix with one normalized embedding per
+        # row, list of the exact-match keys of those rows)
+        self._vectors = {}
+        # get/put may run in executor threads for async entry points
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(app_name: str, agent_name: str, prompt: str) -> bytes:
+        """Returns the exact-match key for a prompt sent to an agent."""
+        raw = f"{app_name}\0{agent_name}\0{_normalize(prompt)}".encode()
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    def _embed(self, prompt: str) -> Optional[np.ndarray]:
+        configure_genai()
+        try:
+            result = genai.embed_content(model=EMBEDDING_MODEL, content=_normalize(prompt))
+        except Exception:
+            # The semantic tier is best-effort; a failed embedding is just a miss
+            return None
+        vector = np.asarray(result["embedding"], dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def _lookup(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            return self._lookup_locked(key)
+
+    def _lookup_locked(self, key: bytes) -> Optional[str]:
+        if key in self._exact:
+            self._exact.move_to_end(key)
+            return self._exact[key]
+        if self._disk is not None and (value := self._disk.get(key)) is not None:
+            self._remember(key, value)
+            return value
+        return None
+
+    def _remember(self, key: bytes, response: str) -> None:
+        self._exact[key] = response
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.maxsize:
+            self._exact.popitem(last=False)
+
+    def get(self, app_name: str, agent_name: str, prompt: str):
+        """Looks up a prompt.
+
+        Returns:
+            A `(key, response, vector)` triple; `response` is None on a miss,
+            and `key` and `vector` (the prompt's embedding, if the semantic
+            tier computed one) should be passed back to `put` once the agent
+            has answered.
+        """
+        key = self.key(app_name, agent_name, prompt)
+        if (response := self._lookup(key)) is not None:
+            return key, response, None
+
+        vector = None
+        if self.semantic and (app_name, agent_name) in self._vectors:
+            vector = self._embed(prompt)
+            if vector is not None:
+                with self._lock:
+                    matrix, keys = self._vectors[(app_name, agent_name)]
+                    scores = matrix @ vector
+                    best = int(np.argmax(scores))
+                    if scores[best] > self.threshold:
+                        response = self._lookup_locked(keys[best])
+        return key, response, vector
+
+    def put(self, app_name: str, agent_name: str, key: bytes, prompt: str,
+            response: str, vector: Optional[np.ndarray] = None) -> None:
+        """Stores the response for a key returned by `get`.
+
+        Pass the vector `get` returned so the prompt is not embedded twice.
+        """
+        if response in _UNCACHEABLE or isinstance(response, Uncacheable):
+            return
+        with self._lock:
+            self._remember(key, response)
+        if self._disk is not None:
+            self._disk.set(key, response)
+
+        if self.semantic and vector is None:
+            vector = self._embed(prompt)
+        if self.semantic and vector is not None:
+            scope = (app_name, agent_name)
+            with self._lock:
+                if scope in self._vectors:
+                    matrix, keys = self._vectors[scope]
+                    matrix = np.vstack((matrix, vector))
+                else:
+                    matrix, keys = vector[np.newaxis, :], []
+                keys.append(key)
+                if len(keys) > self.maxsize:
+                    matrix = matrix[1:]
+                    del keys[0]
+                self._vectors[scope] = (matrix, keys)
+
+    def clear(self) -> None:
+        """Drops every cached response, including the persistent tier."""
+        with self._lock:
+            self._exact.clear()
+            self._vectors.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+
+prompt_cache = PromptCache(
+    semantic=settings.llm_cache_semantic,
+    directory=settings.llm_cache_dir,
+)
+
+
+def cached_run(app_name: str, agent_name: str):
+    """Caches a `run_*(prompt)` entry point's response text.
+
+    Works for both plain and `async` functions; on a hit the wrapped function,
+    and so the runner's event loop, is skipped entirely. For `async` functions
+    the semantic tier's blocking embedding calls run in the default executor.
+    Return an `Uncacheable` str from the function to keep a response out of
+    the cache.
+
+    Args:
+        app_name: The application the agent runs under.
+        agent_name: The root agent answering the prompt.
+
+    Returns:
+        A decorator for functions whose first argument is the prompt.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(prompt: str, *args, **kwargs):
+                if prompt_cache.semantic:
+                    loop = asyncio.get_running_loop()
+                    lookup = functools.partial(prompt_cache.get, app_name, agent_name, prompt)
+                    key, response, vector = await loop.run_in_executor(None, lookup)
+                else:
+                    key, response, vector = prompt_cache.get(app_name, agent_name, prompt)
+                if response is None:
+                    response = await func(prompt, *args, **kwargs)
+                    store = functools.partial(prompt_cache.put, app_name, agent_name, key, prompt, response, vector)
+                    if prompt_cache.semantic:
+                        await loop.run_in_executor(None, store)
+                    else:
+                        store()
+                return response
+        else:
+            @functools.wraps(func)
+            def wrapper(prompt: str, *args, **kwargs):
+                key, response, vector = prompt_cache.get(app_name, agent_name, prompt)
+                if response is None:
+                    response = func(prompt, *args, **kwargs)
+                    prompt_cache.put(app_name, agent_name, key, prompt, response, vector)
+                return response
+        return wrapper
+    return decorator
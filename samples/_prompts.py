@@ -0,0 +1,79 @@
+"""
+Instruction prompts for the ADK samples.
+
+Every prompt is interned, so samples loaded into the same process share a
+single string object per instruction. `build_instruction` assembles prompts
+that also carry session state.
+"""
+
+from sys import intern
+
+
+def build_instruction(static: str, dynamic_keys: list) -> str:
+    """Builds an instruction whose static text comes before any state values.
+
+    ADK substitutes the `{key}` placeholders with session state before each
+    call, so keeping them after the static text leaves the byte-identical
+    part of the system instruction as a prefix Gemini can cache.
+
+    Args:
+        static: The role and task description.
+        dynamic_keys: State keys to append, in order; suffix a key with `?`
+            if it may not be set yet.
+
+    Returns:
+        The interned instruction string.
+    """
+    lines = [f"{key.rstrip('?')}: {{{key}}}" for key in dynamic_keys]
+    return intern("\n".join([static, "<DYNAMIC>", *lines]))
+
+
+PROMPTS = {
+    # 02_sequential_agent
+    "extract": intern(
+        "You are a data extraction agent. "
+        "When given the user message as `input_text`, "
+        "call the Python function `extract_data(input_text)` and return *only* its output."
+    ),
+    "clean": intern(
+        "You are a data cleaning agent. "
+        "Take the extracted data in `raw_data`, "
+        "call the Python function `clean_data(raw_data)`, and return *only* the cleaned data."
+    ),
+    # 03_parallel_agent
+    "weather": intern(
+        "Extract the city name from the user query, call get_weather(city), "
+        "and return only that result."
+    ),
+    "news": intern(
+        "Extract the topic from the user query, call get_news(topic), "
+        "and return only that result."
+    ),
+    # 04_loop_agent
+    "guess": intern(
+        "You are a number-guessing agent. On each turn, "
+        "call `guess_number(input_text)` and return *only* its output."
+    ),
+    # 05_nested_agent
+    "specialized": intern(
+        "You are the specialized agent. Take the user's request string "
+        "and return exactly: 'Specialized result: <their request>'."
+    ),
+    "supervisor": intern(
+        "You are the supervisor. When the user gives you a request, "
+        "call `specialized_tool(request)` and return *only* what that tool returns."
+    ),
+    # 07_tool_context
+    "document": intern(
+        "You are a document analysis agent. When the user asks "
+        "'Analyze <document_name> for <analysis_query>', extract both parts, "
+        "call `process_document(document_name, analysis_query, tool_context)`, "
+        "and return *only* the resulting JSON dictionary."
+    ),
+    # 08_tool_composition
+    "data": intern(
+        "You are the data analyzer. When the user says "
+        "'Analyze data from <source>', extract the <source> string, "
+        "call `analyze_data(source)`, and return *only* its output."
+    ),
+}
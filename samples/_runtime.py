@@ -0,0 +1,196 @@
+"""
+Shared runtime helpers for the ADK samples.
+
+All samples run against one in-memory session service, so importing several of
+them in the same process (tests, a demo launcher) does not build a separate
+service and session store per module.
+"""
+
+import functools
+from collections import OrderedDict
+
+from config import get_settings
+
+import google.generativeai as genai
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.adk.tools import BaseTool, FunctionTool
+from google.genai import types
+
+settings = get_settings()
+
+
+@functools.lru_cache(maxsize=1)
+def configure_genai() -> None:
+    """Configures the Google AI client once, however many samples are imported."""
+    genai.configure(api_key=settings.google_api_key)
+
+
+class BoundedSessionService(InMemorySessionService):
+    """In-memory session service that evicts the least recently used sessions.
+
+    Once more than `max_sessions` sessions are stored, the one used least
+    recently is dropped, together with its user's entry (and `user:` state)
+    when that was the user's last session, so a long-running server that
+    sees many anonymous users stays within the bound.
+
+    The service methods are synchronous and run on the event loop thread, so
+    no locking is needed around the LRU.
+    """
+
+    def __init__(self, max_sessions: int = 10_000):
+        super().__init__()
+        self._max_sessions = max_sessions
+        # (app_name, user_id, session_id), least recently used first
+        self._lru = OrderedDict()
+
+    def _touch(self, app_name: str, user_id: str, session_id: str) -> None:
+        key = (app_name, user_id, session_id)
+        self._lru[key] = None
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_sessions:
+            self._drop(*self._lru.popitem(last=False)[0])
+
+    def _drop(self, app_name: str, user_id: str, session_id: str) -> None:
+        users = self.sessions.get(app_name, {})
+        user_sessions = users.get(user_id, {})
+        user_sessions.pop(session_id, None)
+        if not user_sessions:
+            users.pop(user_id, None)
+            self.user_state.get(app_name, {}).pop(user_id, None)
+        if not users:
+            self.sessions.pop(app_name, None)
+
+    def create_session(self, *, app_name, user_id, state=None, session_id=None):
+        session = super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._touch(app_name, user_id, session.id)
+        return session
+
+    def get_session(self, *, app_name, user_id, session_id, config=None):
+        session = super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is not None:
+            self._touch(app_name, user_id, session_id)
+        return session
+
+    def delete_session(self, *, app_name, user_id, session_id):
+        self._lru.pop((app_name, user_id, session_id), None)
+        self._drop(app_name, user_id, session_id)
+
+    def ensure_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        """Creates a session unless it exists, without copying an existing one."""
+        if session_id in self.sessions.get(app_name, {}).get(user_id, {}):
+            self._touch(app_name, user_id, session_id)
+        else:
+            self.create_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+
+@functools.lru_cache(maxsize=None)
+def get_session_service() -> InMemorySessionService:
+    """Returns the session service shared by every sample in this process."""
+    return InMemorySessionService()
+
+
+@functools.lru_cache(maxsize=None)
+def fresh_session(app_name: str, user_id: str, session_id: str):
+    """Returns the session for a key, creating it in the shared service only once.
+
+    Later calls for the same key return the memoized session without going
+    through `get_session`/`create_session` again.
+    """
+    session_service = get_session_service()
+    session = session_service.get_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id
+    )
+    if session is None:
+        session = session_service.create_session(
+            app_name=app_name,
+            user_id=user_id,
+            session_id=session_id
+        )
+    return session
+
+
+def user_message(text: str) -> types.Content:
+    """Wraps text in a user message.
+
+    Built with `model_construct`, skipping pydantic validation: the role is a
+    constant and the text is already a str, and this runs once per query.
+    """
+    return types.Content.model_construct(role="user", parts=[types.Part.model_construct(text=text)])
+
+
+def session_id_for(agent) -> str:
+    """Returns the session an agent's runner uses in the shared service.
+
+    Each root agent gets its own session, so samples imported into one
+    process never see each other's conversation history.
+    """
+    return f"{settings.default_session_id}_{agent.name}"
+
+
+def make_runner(agent, app_name: str = settings.default_app_name) -> Runner:
+    """Creates a runner for an agent backed by the shared session service.
+
+    The agent's session (see `session_id_for`) is created on first use and
+    reused afterwards.
+
+    Args:
+        agent: The root agent the runner should execute.
+        app_name: The application name sessions are stored under.
+
+    Returns:
+        A runner ready to execute queries in the agent's session.
+    """
+    fresh_session(app_name, settings.default_user_id, session_id_for(agent))
+
+    return Runner(
+        agent=agent,
+        app_name=app_name,
+        session_service=get_session_service()
+    )
+
+
+class CachedFunctionTool(FunctionTool):
+    """FunctionTool that builds its declaration once.
+
+    ADK's FunctionTool reflects over the function's signature and docstring
+    on every LLM request; the result never changes, so it is kept here.
+    """
+
+    def __init__(self, func):
+        super().__init__(func)
+        self._declaration = None
+
+    def _get_declaration(self):
+        if self._declaration is None:
+            self._declaration = super()._get_declaration()
+        return self._declaration
+
+
+def warmup(agent) -> None:
+    """Builds the tool declarations of an agent tree ahead of the first query.
+
+    Plain functions (and plain FunctionTools) are replaced by a
+    CachedFunctionTool, and each declaration is generated now rather than on
+    the critical path of the first `run_*` call; later requests reuse it.
+
+    Args:
+        agent: The root agent whose tools (and sub-agents' tools) to prepare.
+    """
+    tools = getattr(agent, "tools", None) or []
+    for index, tool in enumerate(tools):
+        if type(tool) is FunctionTool:
+            tool = tools[index] = CachedFunctionTool(tool.func)
+        elif not isinstance(tool, BaseTool) and callable(tool):
+            tool = tools[index] = CachedFunctionTool(tool)
+        if isinstance(tool, CachedFunctionTool):
+            tool._get_declaration()
+
+    for sub_agent in getattr(agent, "sub_agents", None) or []:
+        warmup(sub_agent)
@@ -0,0 +1,84 @@
+"""
+Numba kernel for the document pipeline's text statistics.
+
+`scan_terms` finds which of a fixed set of terms occur in a text
+(case-insensitively, as substrings) and counts its whitespace-separated words
+in a single pass over the encoded bytes, instead of one pass per term plus a
+`lower()` and a `split()`.
+
+The kernel only handles ASCII text, where bytes and characters line up; it
+returns None for other text, or when numba is not installed, and the caller
+falls back to plain Python.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional; callers fall back to plain Python
+    njit = None
+
+
+def _scan(buf, terms, lengths):
+    found = 0
+    words = 0
+    in_word = False
+    n = buf.shape[0]
+    for i in range(n):
+        c = buf[i]
+        # same separators as str.split() for ASCII
+        space = c == 32 or 9 <= c <= 13 or 28 <= c <= 31
+        if not space and not in_word:
+            words += 1
+        in_word = not space
+
+        for t in range(terms.shape[0]):
+            length = lengths[t]
+            if i + length > n:
+                continue
+            j = 0
+            while j < length:
+                b = buf[i + j]
+                if 65 <= b <= 90:  # fold A-Z to lowercase
+                    b += 32
+                if b != terms[t, j]:
+                    break
+                j += 1
+            if j == length:
+                found |= 1 << t
+    return found, words
+
+
+if njit is not None:
+    _scan = njit(cache=True, boundscheck=False)(_scan)
+
+
+@lru_cache(maxsize=None)
+def _compile(terms: tuple):
+    """Packs lowercase ASCII terms into a padded byte matrix plus their lengths."""
+    lengths = np.array([len(term) for term in terms], dtype=np.int64)
+    matrix = np.zeros((len(terms), int(lengths.max(initial=0))), dtype=np.uint8)
+    for row, term in enumerate(terms):
+        matrix[row, :len(term)] = np.frombuffer(term.encode("ascii"), dtype=np.uint8)
+    return matrix, lengths
+
+
+def scan_terms(text: str, terms: tuple) -> Optional[tuple]:
+    """Finds the terms occurring in a text and counts its words in one pass.
+
+    Args:
+        text: The text to scan.
+        terms: Lowercase ASCII terms to look for (at most 63).
+
+    Returns:
+        A `(found_terms, word_count)` pair, or None if the kernel cannot be
+        used for this text.
+    """
+    if njit is None or not text.isascii():
+        return None
+    matrix, lengths = _compile(terms)
+    found, words = _scan(np.frombuffer(text.encode("ascii"), dtype=np.uint8), matrix, lengths)
+    return frozenset(term for bit, term in enumerate(terms) if found >> bit & 1), int(words)
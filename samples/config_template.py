@@ -6,36 +6,27 @@ from the project root in any sample.
 """
 
 import sys
-import os
-
-# Add the project root to the Python path for imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from the root config
-from config import (
-    GOOGLE_API_KEY, 
-    DEFAULT_MODEL,
-    DEFAULT_APP_NAME,
-    DEFAULT_USER_ID,
-    DEFAULT_SESSION_ID,
-    MAX_RETRIES,
-    RETRY_DELAY
-)
-
-import google.generativeai as genai
+from config import get_settings
+from samples._runtime import configure_genai
+
+settings = get_settings()
+
 
 # Configure the Google AI client
-genai.configure(api_key=GOOGLE_API_KEY)
-
-# How to check if API key is available
-if not GOOGLE_API_KEY:
-    print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
-    sys.exit(1)
-
-# Example of using other configuration values
-print(f"Using model: {DEFAULT_MODEL}")
-print(f"Application name: {DEFAULT_APP_NAME}")
-print(f"User ID: {DEFAULT_USER_ID}")
-print(f"Session ID: {DEFAULT_SESSION_ID}")
-print(f"Max retries: {MAX_RETRIES}")
-print(f"Retry delay: {RETRY_DELAY}") 
\ No newline at end of file
+configure_genai()
+
+if __name__ == "__main__":
+    # How to check if API key is available
+    if not settings.google_api_key:
+        print("Error: GOOGLE_API_KEY is not set. Please set it in your .env file or environment variables.")
+        sys.exit(1)
+
+    # Example of using other configuration values
+    print(f"Using model: {settings.default_model}")
+    print(f"Application name: {settings.default_app_name}")
+    print(f"User ID: {settings.default_user_id}")
+    print(f"Session ID: {settings.default_session_id}")
+    print(f"Max retries: {settings.max_retries}")
+    print(f"Retry delay: {settings.retry_delay}")
@@ -0,0 +1,12 @@
+#!/usr/bin/env sh
+# Precompiles the samples to bytecode so repeat runs skip compilation.
+#
+# Set PYTHONPYCACHEPREFIX (e.g. /var/cache/adk-pyc) both here and when running
+# the samples to keep the .pyc files in one shared cache directory.
+#
+# Do not run the samples with -OO: it strips docstrings, which ADK uses to
+# describe tool functions to the model.
+set -e
+
+cd "$(dirname "$0")/.."
+python -m compileall -q -j 0 config.py samples tools
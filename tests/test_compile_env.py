@@ -0,0 +1,25 @@
+"""Tests for the .env compiler used by config.py."""
+
+import importlib.util
+
+from tools.compile_env import compile_env
+
+
+def _load(path):
+    spec = importlib.util.spec_from_file_location("env_cache", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_non_identifier_keys_still_compile(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("DEFAULT_MODEL=gemini-2.0-flash\nMY-KEY=dash\nclass=keyword\n")
+    output = tmp_path / "env_cache.py"
+
+    assert compile_env(str(env_file), str(output)) == 3
+
+    env_cache = _load(output)
+    assert env_cache.VALUES == {"DEFAULT_MODEL": "gemini-2.0-flash", "MY-KEY": "dash", "class": "keyword"}
+    assert env_cache.DEFAULT_MODEL == "gemini-2.0-flash"
+    assert env_cache.__all__ == ["VALUES", "DEFAULT_MODEL"]
@@ -0,0 +1,40 @@
+"""Tests for the runner harness shared by the basic samples."""
+
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk.agents import LlmAgent
+from google.adk.models import BaseLlm, LlmResponse
+from google.genai import types
+
+from samples import _harness
+
+
+class EchoLlm(BaseLlm):
+    """Answers every request with a fixed reply, without calling a model."""
+
+    model: str = "echo"
+    reply: str = "echo"
+
+    async def generate_content_async(self, llm_request, stream=False) -> AsyncGenerator[LlmResponse, None]:
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=self.reply)]))
+
+
+def _agent(reply):
+    return LlmAgent(name="echo_agent", model=EchoLlm(reply=reply), instruction="Echo.")
+
+
+def test_arun_works_inside_a_running_loop():
+    async def main():
+        return await _harness.arun(_agent("hello"), "hi")
+
+    assert asyncio.run(main()) == "hello"
+
+
+def test_runners_are_cached_per_agent_object():
+    first, second = _agent("first"), _agent("second")
+
+    assert _harness.get_runner(first) is _harness.get_runner(first)
+    assert _harness.get_runner(first) is not _harness.get_runner(second)
+    assert _harness.run(first, "hi") == "first"
+    assert _harness.run(second, "hi") == "second"
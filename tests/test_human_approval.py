@@ -0,0 +1,32 @@
+"""Tests for how the human approval sample reads the reviewer's answer."""
+
+import importlib
+
+import pytest
+
+human_approval = importlib.import_module("samples.16_human_approval.human_approval")
+
+
+@pytest.mark.parametrize("answer, count, expected", [
+    (" Y ", 1, [True]),
+    ("yes", 1, [True]),
+    ("No", 1, [False]),
+    ("yn", 2, [True, False]),
+    ("yes no", 2, [True, False]),
+    ("all", 3, [True, True, True]),
+    ("s", 2, [False, False]),
+])
+def test_recognized_answers(answer, count, expected):
+    assert human_approval._parse_decisions(answer, count) == expected
+
+
+@pytest.mark.parametrize("answer, count", [("", 1), ("sure", 1), ("y", 2), ("yny", 2), ("a", 1)])
+def test_unrecognized_answers_are_rejected(answer, count):
+    assert human_approval._parse_decisions(answer, count) is None
+
+
+def test_reviewer_is_asked_again_after_an_unrecognized_answer(monkeypatch):
+    answers = iter(["maybe", "yes"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+    assert human_approval._ask_reviewer([("email", "send it")]) == [True]
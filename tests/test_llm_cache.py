@@ -0,0 +1,65 @@
+"""Tests for the response cache of the LLM-backed sample entry points."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from samples import _llm_cache
+from samples._llm_cache import PromptCache, Uncacheable, cached_run
+
+
+def _same_vector(prompt):
+    # every prompt embeds to the same direction, so any stored row matches
+    vector = np.ones(8, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def semantic_cache(monkeypatch):
+    cache = PromptCache(semantic=True)
+    monkeypatch.setattr(cache, "_embed", _same_vector)
+    monkeypatch.setattr(_llm_cache, "prompt_cache", cache)
+    return cache
+
+
+def test_semantic_hit_within_the_same_agent(semantic_cache):
+    key, response, vector = semantic_cache.get("app", "research", "AI ethics")
+    assert response is None
+    semantic_cache.put("app", "research", key, "AI ethics", "report", vector)
+
+    assert semantic_cache.get("app", "research", "ethics of AI")[1] == "report"
+
+
+def test_semantic_tier_is_scoped_by_app_and_agent(semantic_cache):
+    key, _, vector = semantic_cache.get("app", "research", "AI ethics")
+    semantic_cache.put("app", "research", key, "AI ethics", "report", vector)
+
+    assert semantic_cache.get("app", "refiner", "AI ethics")[1] is None
+    assert semantic_cache.get("other_app", "research", "AI ethics")[1] is None
+
+
+def test_entry_points_do_not_share_semantic_matches(semantic_cache):
+    @cached_run("app", "research_pipeline")
+    async def run_research(topic):
+        return f"research report on {topic}"
+
+    @cached_run("app", "content_refiner")
+    def run_content_refiner(topic):
+        return f"refined draft on {topic}"
+
+    assert asyncio.run(run_research("AI ethics")) == "research report on AI ethics"
+    assert run_content_refiner("AI ethics") == "refined draft on AI ethics"
+
+
+def test_uncacheable_responses_are_not_stored(semantic_cache):
+    calls = []
+
+    @cached_run("app", "research_pipeline")
+    async def run_research(topic):
+        calls.append(topic)
+        return Uncacheable("News Insights: No response received.")
+
+    asyncio.run(run_research("AI ethics"))
+    asyncio.run(run_research("AI ethics"))
+    assert len(calls) == 2
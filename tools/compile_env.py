@@ -0,0 +1,65 @@
+"""
+Compiles a `.env` file into an importable `env_cache.py` module.
+
+Parsing `.env` with python-dotenv on every interpreter start is unnecessary
+once a deployment's configuration is fixed. This script reads the file once
+and writes its values as plain Python literals, so `config.py` can import them
+and let the bytecode cache do the rest.
+
+Usage:
+    python tools/compile_env.py [--env-file .env] [--output env_cache.py]
+
+Re-run it whenever `.env` changes; delete `env_cache.py` to go back to parsing
+`.env` directly.
+"""
+
+import argparse
+import keyword
+import os
+
+from dotenv import dotenv_values
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def compile_env(env_file: str, output: str) -> int:
+    """Writes the values of `env_file` to `output` as Python literals.
+
+    Every variable goes into the module's `VALUES` dict; those whose names are
+    valid Python identifiers are also written as module-level constants.
+
+    Args:
+        env_file: Path to the `.env` file to read.
+        output: Path of the Python module to generate.
+
+    Returns:
+        The number of variables written.
+    """
+    values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+
+    lines = [
+        f'"""Generated by tools/compile_env.py from {os.path.basename(env_file)} - do not edit."""',
+        "",
+    ]
+    # .env names may contain characters (e.g. "-" or ".") that cannot appear
+    # in an assignment, so only identifiers get a constant of their own
+    names = [key for key in values if key.isidentifier() and not keyword.iskeyword(key)]
+
+    lines.append(f"VALUES = {values!r}")
+    lines += ["", *(f"{key} = {values[key]!r}" for key in names)]
+    lines += ["", f"__all__ = {['VALUES', *names]!r}", ""]
+
+    with open(output, "w") as module_file:
+        module_file.write("\n".join(lines))
+
+    return len(values)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile .env into env_cache.py")
+    parser.add_argument("--env-file", default=os.path.join(PROJECT_ROOT, ".env"))
+    parser.add_argument("--output", default=os.path.join(PROJECT_ROOT, "env_cache.py"))
+    args = parser.parse_args()
+
+    count = compile_env(args.env_file, args.output)
+    print(f"Wrote {count} variables to {args.output}")